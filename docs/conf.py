@@ -2,7 +2,9 @@
 import os
 import sys
 
-sys.path.insert(0, os.path.abspath("../"))
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 # -- Project information -----------------------------------------------------
 project = "Loglan-Core"
@@ -39,4 +41,5 @@ html_theme = "sphinx_rtd_theme"
 templates_path = ["_templates"]
 exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 
-# sphinx-build -b html . _build/html
+# Parallel build that keeps doctrees between runs for incremental rebuilds:
+# sphinx-build -j auto -d _build/doctrees -b html . _build/html
@@ -1,9 +1,18 @@
 """
 Main point for export DB models
+
+The models are imported eagerly, so the whole model graph and all tables
+are registered on `Base.metadata` as soon as the package is imported.
+The addons are resolved lazily on first access (PEP 562).
 """
 
 # fmt: off
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __author__ = "torrua"
 __copyright__ = "Copyright 2024, loglan_core project"
 __email__ = "torrua@gmail.com"
@@ -13,13 +22,7 @@ from loglan_core.relationships import (
     t_connect_words,
     t_connect_keys,
 )
-from .addons.base_selector import BaseSelector
-from .addons.definition_selector import DefinitionSelector
-from .addons.export_word_converter import ExportWordConverter
-from .addons.exporter import Exporter
-from .addons.key_selector import KeySelector
-from .addons.word_linker import WordLinker
-from .addons.word_selector import WordSelector
+from . import addons
 from .author import BaseAuthor as Author
 from .base import BaseModel as Base
 from .definition import BaseDefinition as Definition
@@ -30,3 +33,55 @@ from .syllable import BaseSyllable as Syllable
 from .type import BaseType as Type
 from .word import BaseWord as Word
 from .word_spell import BaseWordSpell as WordSpell
+
+_lazy_imports: dict[str, tuple[str, str]] = {
+    "BaseSelector": (".addons.base_selector", "BaseSelector"),
+    "DefinitionSelector": (".addons.definition_selector", "DefinitionSelector"),
+    "ExportWordConverter": (".addons.export_word_converter", "ExportWordConverter"),
+    "Exporter": (".addons.exporter", "Exporter"),
+    "KeySelector": (".addons.key_selector", "KeySelector"),
+    "WordLinker": (".addons.word_linker", "WordLinker"),
+    "WordSelector": (".addons.word_selector", "WordSelector"),
+}
+
+__all__ = [
+    "t_connect_authors",
+    "t_connect_words",
+    "t_connect_keys",
+    *_lazy_imports,
+    "Author",
+    "Base",
+    "Definition",
+    "Event",
+    "Key",
+    "Setting",
+    "Syllable",
+    "Type",
+    "Word",
+    "WordSpell",
+]
+
+if TYPE_CHECKING:
+    from .addons.base_selector import BaseSelector
+    from .addons.definition_selector import DefinitionSelector
+    from .addons.export_word_converter import ExportWordConverter
+    from .addons.exporter import Exporter
+    from .addons.key_selector import KeySelector
+    from .addons.word_linker import WordLinker
+    from .addons.word_selector import WordSelector
+
+
+def __getattr__(name: str) -> Any:
+    """Import the requested addon on first access and cache it."""
+    try:
+        module_name, attr_name = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,20 +2,111 @@
 This module provides a base selector for SQLAlchemy
 """
 
-from typing import Type, Iterable, Any
-
-from sqlalchemy import select, Select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session, InstrumentedAttribute, joinedload
+from functools import lru_cache
+from typing import Type, Iterable, Any, Callable
+
+from sqlalchemy import func, select, Row, Select, ScalarResult
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncScalarResult
+from sqlalchemy.orm import (
+    Session,
+    InstrumentedAttribute,
+    joinedload,
+    raiseload,
+    selectinload,
+)
+from sqlalchemy.sql.operators import ColumnOperators
 from sqlalchemy.types import String, Integer
 from typing_extensions import Self
 
+from .filters import to_like_pattern
 from ..base import BaseModel
 
+_BASE_SELECT_CACHE: dict[type, Select] = {}
+"""Initial `select(model)` statements shared between selectors of the same model."""
+
+
+def _base_select(model: type) -> Select:
+    """Return the initial statement for the model, creating it once per model."""
+    statement = _BASE_SELECT_CACHE.get(model)
+    if statement is None:
+        statement = _BASE_SELECT_CACHE[model] = select(model)
+    return statement
+
+
+@lru_cache(maxsize=256)
+def _relationship_options(
+    model: type,
+    selected: frozenset[str] | None,
+    strategy: Callable | None = None,
+) -> tuple:
+    """Build the eager loading options for the model relationships once per selection.
+
+    Unless a strategy is given, collections are loaded with `selectinload`
+    to avoid multiplying the parent rows, while many-to-one relationships
+    are loaded with `joinedload` in the same query.
+
+    Args:
+        model (type): The model to load the relationships of.
+        selected (frozenset[str] | None): Relationship names to include, or None for all.
+        strategy (Callable | None): Loader option to use for every relationship.
+
+    Raises:
+        AttributeError: If some of the selected names are not relationships of the model.
 
-class BaseSelector:  # pylint: disable=too-many-ancestors
+    Returns:
+        tuple: Loader options to pass to `Select.options`.
     """
-    A custom base selector that inherits from SQLAlchemy's Select class.
+    available = model.relationships()
+    if selected is not None:
+        unknown = selected - available
+        if unknown:
+            raise AttributeError(
+                f"Model {model} has no relationships {', '.join(sorted(unknown))}"
+            )
+
+    relationships = model.__mapper__.relationships
+    # Sorted, so the options and the compiled cache key do not depend on set order
+    return tuple(
+        (strategy or (selectinload if relationships[name].uselist else joinedload))(
+            getattr(model, name)
+        )
+        for name in sorted(available if selected is None else selected)
+    )
+
+
+@lru_cache(maxsize=256)
+def _raiseload_options(model: type, loaded: frozenset[str]) -> tuple:
+    """Build `raiseload` options for the lazily loaded relationships of the model.
+
+    Only relationships mapped with the default lazy "select" strategy are affected,
+    so the ones the mapper loads eagerly (e.g. `lazy="joined"`) keep working.
+
+    Args:
+        model (type): The model to forbid lazy loading for.
+        loaded (frozenset[str]): Relationship names loaded with explicit options.
+
+    Returns:
+        tuple: Loader options to pass to `Select.options`.
+    """
+    return tuple(
+        raiseload(getattr(model, relationship.key))
+        for relationship in sorted(
+            model.__mapper__.relationships, key=lambda item: item.key
+        )
+        if relationship.lazy == "select" and relationship.key not in loaded
+    )
+
+
+def _glob(column, value: str):
+    """Case-sensitive pattern match for SQLite."""
+    return column.op("GLOB")(value)
+
+
+# The selector mirrors the chainable Select API and the Result fetch methods,
+# so its public surface is intentionally wide.
+class BaseSelector:  # pylint: disable=too-many-ancestors,too-many-public-methods
+    """
+    A custom base selector that wraps SQLAlchemy's Select statement.
     This class provides methods to execute a session and fetch results
     in different ways. It also provides a way to fetch many results.
 
@@ -27,14 +118,40 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
     all(session: Session) -> List[ResultRow]:
         Executes the session and returns all the results.
 
+    rows(session: Session) -> List[Row]:
+        Executes the session and returns all the rows as tuples of the selected columns.
+
     scalar(session: Session) -> Any:
         Executes the session and returns a scalar result.
 
     fetchmany(session: Session, size: int | None = None) -> List[ResultRow]:
         Executes the session and fetches a specified number of results.
 
+    count(session: Session) -> int:
+        Counts the results with SELECT COUNT(*) without loading them.
+
+    stream(session: Session, yield_per: int = 1000) -> ScalarResult:
+        Executes the session and fetches the results in batches.
+
     """
 
+    __slots__ = (
+        "disable_model_check",
+        "model",
+        "_is_sqlite",
+        "_case_sensitive",
+        "_statement",
+        "_selected_columns",
+        "_pending_conditions",
+        "_like_operator",
+        "_like_wildcards",
+        "_loaded_relationships",
+        "_strict_relationships",
+    )
+
+    _LIKE_WILDCARDS = frozenset("*%_")
+    _GLOB_WILDCARDS = frozenset("*?[")
+
     def __init__(
         self,
         model: Type[BaseModel],
@@ -55,11 +172,35 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
             self._is_model_accepted(model, BaseModel)
 
         self.model = model
-        self._statement = select(self.model)
+        self._statement = _base_select(self.model)
         self._selected_columns = [self.model]
-
-        self.is_sqlite = is_sqlite
-        self.case_sensitive = case_sensitive
+        self._pending_conditions: list = []
+        self._loaded_relationships: frozenset[str] = frozenset()
+        self._strict_relationships = False
+
+        self._is_sqlite = is_sqlite
+        self._case_sensitive = case_sensitive
+        self._update_like_operator()
+
+    @property
+    def is_sqlite(self) -> bool:
+        """Flag indicating if the database is SQLite."""
+        return self._is_sqlite
+
+    @is_sqlite.setter
+    def is_sqlite(self, value: bool) -> None:
+        self._is_sqlite = value
+        self._update_like_operator()
+
+    @property
+    def case_sensitive(self) -> bool:
+        """Flag indicating if the queries should be case-sensitive."""
+        return self._case_sensitive
+
+    @case_sensitive.setter
+    def case_sensitive(self, value: bool) -> None:
+        self._case_sensitive = value
+        self._update_like_operator()
 
     def select_columns(self, *columns: type[BaseModel]) -> Self:
         """Specify which columns to select without resetting the filters.
@@ -71,12 +212,7 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
             Self: The current instance for method chaining.
         """
         self._selected_columns = list(columns)
-        existing_conditions = self._statement.whereclause
-
-        if existing_conditions is None:
-            self._statement = select(*self._selected_columns)
-        else:
-            self._statement = select(*self._selected_columns).where(existing_conditions)
+        self._statement = self._statement.with_only_columns(*self._selected_columns)
         return self
 
     def limit(self, limit: int) -> Self:
@@ -103,6 +239,22 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
         self._statement = self._statement.offset(offset)
         return self
 
+    def yield_per(self, count: int) -> Self:
+        """Fetch the results in batches of the given size on execution.
+
+        This sets the ``yield_per`` execution option, which also enables
+        server-side cursors where the driver supports them.
+        See `stream` for the restrictions of this mode.
+
+        Args:
+            count (int): The number of rows to fetch per batch.
+
+        Returns:
+            Self: The current instance for method chaining.
+        """
+        self._statement = self._statement.execution_options(yield_per=count)
+        return self
+
     def order_by(self, *columns) -> Self:
         """Specify the order in which results should be returned.
 
@@ -124,27 +276,29 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
         Returns:
             Self: The current instance for method chaining.
         """
-
-        self._statement = self._statement.filter(*args)
-
-        return self
+        return self.where(*args)
 
     def filter_by(self, **kwargs) -> Self:
         """Filter results based on arbitrary keyword arguments.
+            Unlike `where`, the filter is applied immediately, so the names
+            are resolved against the last joined entity, like in `Select.filter_by`.
 
         Args:
             *kwargs: Column-value pairs to filter by.
 
+        Raises:
+            InvalidRequestError: If the entity has no attribute with one of the given names.
+
         Returns:
             Self: The current instance for method chaining.
         """
-
         self._statement = self._statement.filter_by(**kwargs)
-
         return self
 
     def where(self, *args) -> Self:
         """Filter results based on arbitrary keyword arguments.
+            Conditions are collected and added to the statement
+            in one step when it is requested with `get_statement`.
 
         Args:
             *args: Column-value pairs to filter by.
@@ -152,12 +306,12 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
         Returns:
             Self: The current instance for method chaining.
         """
-        self._statement = self._statement.where(*args)
+        self._pending_conditions.extend(args)
         return self
 
     def where_like(self, **kwargs) -> Self:
         """Filter results based on arbitrary keyword arguments.
-            Use internal method `_generate_column_condition` to generate
+            Use method `get_like_condition` to generate
             the condition based on settings provided by Selector instance
             like (is_sqlite, case_sensitive).
 
@@ -167,13 +321,17 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
         Returns:
             Self: The current instance for method chaining.
         """
-        for key, value in kwargs.items():
-            self._statement = self._statement.where(self.get_like_condition(key, value))
-        return self
+        return self.where(
+            *(self.get_like_condition(key, value) for key, value in kwargs.items())
+        )
 
     def get_like_condition(self, key: str | InstrumentedAttribute, value: Any):
         """Generate the condition based on settings provided by Selector instance
         like (is_sqlite, case_sensitive).
+            A case-sensitive search for a value without wildcards
+            ('*' or those of the LIKE or GLOB operator in use)
+            is generated as a plain equality, so it can use an index.
+            A collection of values for an integer column is matched with IN.
 
         Args:
             key (str | InstrumentedAttribute): The key of the column to filter by.
@@ -183,52 +341,127 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
             Condition: The SQLAlchemy condition to filter by.
         """
         column = self._get_column(key)
+        column_type = column.type
 
-        if not isinstance(column.type, (String, Integer)):
+        if not isinstance(column_type, String):
+            if isinstance(column_type, Integer):
+                if isinstance(value, (list, tuple, set, frozenset)):
+                    return column.in_([int(item) for item in value])
+                return column == (value if isinstance(value, int) else int(value))
             return column == value
 
-        if isinstance(column.type, Integer):
-            return column == int(value)
-
-        value = value.replace("*", "%")
-
-        if not self.case_sensitive:
-            return column.ilike(value)
-
-        if self.is_sqlite:
-            return column.op("GLOB")(value)
+        value = value if isinstance(value, str) else str(value)
+        if self._case_sensitive and self._like_wildcards.isdisjoint(value):
+            return column == value
 
-        return column.like(value)
+        return self._like_operator(column, to_like_pattern(value))
 
     def get_statement(self) -> Select:
         """Get the current SQLAlchemy _statement.
+            Pending conditions are applied first, and the `raiseload` options
+            of `strict_relationships` are added to the returned statement
+            if the model is among the selected columns.
 
         Returns:
             Select: The current SQLAlchemy _statement.
         """
+        if self._pending_conditions:
+            self._statement = self._statement.where(*self._pending_conditions)
+            self._pending_conditions = []
+        # Loader options only apply when the model itself is selected.
+        # Columns overload ==, so membership is checked by identity.
+        if self._strict_relationships and any(
+            column is self.model for column in self._selected_columns
+        ):
+            return self._statement.options(
+                *_raiseload_options(self.model, self._loaded_relationships)
+            )
         return self._statement
 
-    def with_relationships(self, selected: Iterable[str] | None = None) -> Self:
+    def with_relationships(
+        self,
+        selected: Iterable[str] | str | None = None,
+        strategy: Callable | None = None,
+        strict: bool = False,
+    ) -> Self:
         """Adds relationships to the query.
 
         Args:
-            selected (set[str]): A set of relationship names to include.
-            Defaults to None if all relationships should be included.
+            selected (set[str] | str): A set of relationship names to include,
+            or a single name. Defaults to None if all relationships should be included.
+            An empty iterable includes no relationships.
+            strategy (Callable | None): Loader option such as `joinedload`
+            to use for every relationship. Defaults to None, which loads
+            collections with `selectinload` and single objects with `joinedload`.
+            Collections loaded with `joinedload` cannot be fetched in batches,
+            so such a selector fails with `InvalidRequestError` in `stream`,
+            `stream_async` and after `yield_per`.
+            strict (bool): Whether to forbid lazy loading of all other
+            relationships, see `strict_relationships`. Defaults to False.
+
+        Raises:
+            AttributeError: If some of the selected names are not relationships of the model.
 
         Returns:
             Self: A query with the relationships added.
         """
-        available_relationships = {
-            attr: getattr(self.model, attr) for attr in self.model.relationships()
-        }
-        relationships = {
-            joinedload(v)
-            for k, v in available_relationships.items()
-            if not selected or k in selected
-        }
-        self._statement = self._statement.options(*relationships)
+        if isinstance(selected, str):
+            selected = (selected,)
+        selected_key = None if selected is None else frozenset(selected)
+        if selected_key is None or selected_key:
+            options = _relationship_options(self.model, selected_key, strategy)
+            self._statement = self._statement.options(*options)
+            self._loaded_relationships |= (
+                self.model.relationships() if selected_key is None else selected_key
+            )
+        return self.strict_relationships() if strict else self
+
+    def strict_relationships(self) -> Self:
+        """Forbid lazy loading of the relationships that are not loaded eagerly.
+
+        Accessing such a relationship on a selected object raises
+        `InvalidRequestError` instead of silently emitting a query per object.
+        Relationships added with `with_relationships`, before or after this call,
+        and the ones the mapper loads eagerly (e.g. `lazy="joined"`) are still loaded.
+
+        Returns:
+            Self: The current instance for method chaining.
+        """
+        self._strict_relationships = True
         return self
 
+    def _update_like_operator(self) -> None:
+        """Pick the pattern-matching operator and its wildcards for the current flags.
+
+        Called whenever `is_sqlite` or `case_sensitive` changes,
+        so `get_like_condition` never has to branch on them.
+        """
+        self._like_operator = self._choose_like_operator(
+            self._is_sqlite, self._case_sensitive
+        )
+        self._like_wildcards = (
+            self._GLOB_WILDCARDS if self._is_sqlite else self._LIKE_WILDCARDS
+        )
+
+    @staticmethod
+    def _choose_like_operator(
+        is_sqlite: bool, case_sensitive: bool
+    ) -> Callable[[Any, str], Any]:
+        """Pick the pattern-matching operator for the selector settings.
+
+        Args:
+            is_sqlite (bool): Flag indicating if the database is SQLite.
+            case_sensitive (bool): Flag indicating if the queries should be case-sensitive.
+
+        Returns:
+            Callable: A function of (column, pattern) returning the condition.
+        """
+        if not case_sensitive:
+            return ColumnOperators.ilike
+        if is_sqlite:
+            return _glob
+        return ColumnOperators.like
+
     @staticmethod
     def _is_model_accepted(model, parent: type[BaseModel] = BaseModel):
         """Checks if the model is an instance of BaseModel or its child.
@@ -251,11 +484,42 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
         Returns:
             InstrumentedAttribute: The SQLAlchemy column to filter by.
         """
-        column = getattr(self.model, key, None) if isinstance(key, str) else key
+        if isinstance(key, str):
+            return self._resolve_column(self.model, key)
+        return key
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _resolve_column(model: type[BaseModel], key: str) -> InstrumentedAttribute:
+        """Resolve a column name to the model attribute, caching the result.
+
+        Args:
+            model (type[BaseModel]): The model to get the attribute from.
+            key (str): The name of the attribute.
+
+        Raises:
+            AttributeError: If the model has no attribute with the given key.
+
+        Returns:
+            InstrumentedAttribute: The SQLAlchemy column to filter by.
+        """
+        column = getattr(model, key, None)
         if column is None:
-            raise AttributeError(f"Model {self.model} has no attribute {key}")
+            raise AttributeError(f"Model {model} has no attribute {key}")
         return column
 
+    def _count_statement(self) -> Select:
+        """Wrap the current statement into a SELECT COUNT(*) query.
+
+        The ordering is dropped, as it does not change the number of rows.
+        Loader options only apply to ORM entities and are ignored in the subquery.
+
+        Returns:
+            Select: The statement counting the rows of the current one.
+        """
+        subquery = self.get_statement().order_by(None).subquery()
+        return select(func.count()).select_from(subquery)
+
     def execute(self, session: Session, unique: bool = False) -> Any:
         """Executes the given session and returns the result.
 
@@ -266,7 +530,7 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
         Returns:
             ResultProxy: The result of the executed session.
         """
-        result = session.execute(self._statement)
+        result = session.execute(self.get_statement())
         return result.unique() if unique else result
 
     def all(self, session: Session, unique: bool = False):
@@ -281,6 +545,21 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
         """
         return self.execute(session, unique).scalars().all()
 
+    def rows(self, session: Session, unique: bool = False) -> list[Row]:
+        """Executes the given session and returns all the rows as a list.
+
+        Unlike `all`, every selected column is kept, so it is meant to be used
+        after `select_columns` with several columns instead of loading whole objects.
+
+        Args:
+            session (Session): SQLAlchemy Session object.
+            unique (bool, optional): Flag indicating if the result should contain unique items.
+            Defaults to False.
+        Returns:
+            list[Row]: All the rows of the executed session.
+        """
+        return list(self.execute(session, unique).all())
+
     def scalar(self, session: Session):
         """Executes the given session and returns a scalar result.
 
@@ -307,6 +586,36 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
         """
         return self.execute(session, unique).scalars().fetchmany(size)
 
+    def count(self, session: Session) -> int:
+        """Counts the results in the database without loading them.
+
+        Args:
+            session (Session): SQLAlchemy Session object.
+        Returns:
+            int: The number of rows the statement selects.
+        """
+        return session.execute(self._count_statement()).scalar_one()
+
+    def stream(self, session: Session, yield_per: int = 1000) -> ScalarResult:
+        """Executes the given session and returns the results lazily.
+
+        Rows are fetched from the database in batches of ``yield_per``,
+        so memory use does not grow with the size of the result set.
+        The session must stay open while the result is being iterated.
+        Joined eager loading of collections is not supported in this mode.
+        Collections added with `with_relationships` use `selectinload` by default,
+        but with `strategy=joinedload` the execution raises `InvalidRequestError`.
+
+        Args:
+            session (Session): SQLAlchemy Session object.
+            yield_per (int, optional): Number of rows to fetch per batch.
+            Defaults to 1000.
+        Returns:
+            ScalarResult: An iterable over the results of the executed session.
+        """
+        statement = self.get_statement().execution_options(yield_per=yield_per)
+        return session.execute(statement).scalars()
+
     async def execute_async(self, session: AsyncSession, unique: bool = False):
         """Executes the given session and returns the result.
 
@@ -317,7 +626,7 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
         Returns:
             ResultProxy: The result of the executed session.
         """
-        result = await session.execute(self._statement)
+        result = await session.execute(self.get_statement())
         return result.unique() if unique else result
 
     async def all_async(self, session: AsyncSession, unique: bool = False):
@@ -333,6 +642,24 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
         result = await self.execute_async(session, unique)
         return result.scalars().all()
 
+    async def rows_async(
+        self, session: AsyncSession, unique: bool = False
+    ) -> list[Row]:
+        """Executes the given session and returns all the rows as a list.
+
+        Unlike `all_async`, every selected column is kept, so it is meant to be used
+        after `select_columns` with several columns instead of loading whole objects.
+
+        Args:
+            session (AsyncSession): SQLAlchemy Session object.
+            unique (bool, optional): Flag indicating if the result should contain unique items.
+            Defaults to False.
+        Returns:
+            list[Row]: All the rows of the executed session.
+        """
+        result = await self.execute_async(session, unique)
+        return list(result.all())
+
     async def scalar_async(self, session: AsyncSession):
         """Executes the given session and returns a scalar result.
 
@@ -360,3 +687,34 @@ class BaseSelector:  # pylint: disable=too-many-ancestors
         """
         result = await self.execute_async(session, unique)
         return result.scalars().fetchmany(size)
+
+    async def count_async(self, session: AsyncSession) -> int:
+        """Counts the results in the database without loading them.
+
+        Args:
+            session (AsyncSession): SQLAlchemy Session object.
+        Returns:
+            int: The number of rows the statement selects.
+        """
+        result = await session.execute(self._count_statement())
+        return result.scalar_one()
+
+    async def stream_async(
+        self, session: AsyncSession, yield_per: int = 1000
+    ) -> AsyncScalarResult:
+        """Executes the given session and returns the results lazily.
+
+        Rows are fetched from the database in batches of ``yield_per``
+        using a server-side cursor. The session must stay open while
+        the result is being iterated with ``async for``.
+        Collections must not be loaded with `joinedload`, see `stream`.
+
+        Args:
+            session (AsyncSession): SQLAlchemy Session object.
+            yield_per (int, optional): Number of rows to fetch per batch.
+            Defaults to 1000.
+        Returns:
+            AsyncScalarResult: An async iterable over the results of the executed session.
+        """
+        statement = self.get_statement().execution_options(yield_per=yield_per)
+        return await session.stream_scalars(statement)
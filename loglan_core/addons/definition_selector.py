@@ -2,7 +2,7 @@
 This module provides the DefinitionSelector class which is a Selector for the BaseDefinition object.
 
 The DefinitionSelector class allows for querying and filtering of BaseDefinition objects based on
-various parameters such as event, key, and language. It is a subclass of the Select class.
+various parameters such as event, key, and language. It is a subclass of BaseSelector.
 
 Classes:
     DefinitionSelector: A selector model for the BaseDefinition object, it allows for querying and
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 from typing import Type
 
-from sqlalchemy import select, true
+from sqlalchemy import and_, select
 from typing_extensions import Self
 
 from loglan_core.relationships import t_connect_keys
@@ -32,11 +32,10 @@ class DefinitionSelector(BaseSelector):  # pylint: disable=too-many-ancestors
     """
     This class is a selector model for the BaseDefinition object. It allows for
     querying and filtering of BaseDefinition objects based on various parameters
-    such as event, key, and language. It is a subclass of the Select class.
+    such as event, key, and language. It is a subclass of BaseSelector.
 
     Methods:
         __init__: Initializes the DefinitionSelector object.
-        inherit_cache: Property that always returns True.
         by_event: Returns a new DefinitionSelector object filtered by a specific event.
         by_key: Returns a BaseQuery object filtered by a specific key.
         by_language: Returns a new DefinitionSelector object filtered by a specific language.
@@ -49,6 +48,8 @@ class DefinitionSelector(BaseSelector):  # pylint: disable=too-many-ancestors
         is_sqlite: Boolean specifying if the object is being used with SQLite or not.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         model: Type[BaseDefinition] = BaseDefinition,
@@ -87,21 +88,30 @@ class DefinitionSelector(BaseSelector):  # pylint: disable=too-many-ancestors
         Returns:
             DefinitionSelector: The filtered DefinitionSelector instance.
         """
-        subquery = (
-            select(self.model.id)
-            .join(t_connect_keys)
-            .join(BaseWord)
-            .where(filter_word_by_event_id(event_id))
-            .scalar_subquery()
+        # Correlated EXISTS lets the database plan semi-joins
+        # instead of matching ids against a materialized subquery.
+        # Only the definitions are correlated, so joined words are not reused.
+        word_in_event = (
+            select(1)
+            .select_from(BaseWord)
+            .where(BaseWord.id == self.model.word_id, filter_word_by_event_id(event_id))
+            .correlate(self.model)
+            .exists()
+        )
+        has_keys = (
+            select(1)
+            .select_from(t_connect_keys)
+            .where(t_connect_keys.c.DID == self.model.id)
+            .correlate(self.model)
+            .exists()
         )
-        self._statement = self._statement.where(self.model.id.in_(subquery))
-        return self
+        return self.where(word_in_event, has_keys)
 
     def by_key(
         self,
         key: BaseKey | str,
         language: str | None = None,
-        distinct: bool = False,
+        distinct: bool = False,  # pylint: disable=unused-argument
     ) -> Self:
         """
         This method filters the definitions by the provided key, language and case sensitivity.
@@ -110,33 +120,24 @@ class DefinitionSelector(BaseSelector):  # pylint: disable=too-many-ancestors
             key (BaseKey | str): The key to filter by. Can be an instance of BaseKey or a string.
             language (str | None): The language to filter by.
             If None, no language filtering is applied.
-            distinct (bool): If True, only distinct keys will be returned.
+            distinct (bool): Kept for backward compatibility. The keys are matched
+            with EXISTS, so each definition is returned at most once anyway.
 
         Returns:
-            Self: The filtered DefinitionSelector instance with distinct keys.
+            Self: The filtered DefinitionSelector instance.
         """
 
-        search_key = key.word if isinstance(key, BaseKey) else str(key)
-        filter_key = filter_key_by_word_cs(
-            search_key, self.case_sensitive, self.is_sqlite
-        )
-        filter_language = filter_key_by_language(
-            key.language if isinstance(key, BaseKey) else language
-        )
+        if isinstance(key, BaseKey):
+            key, language = key.word, key.language
+        filter_key = filter_key_by_word_cs(key, self.case_sensitive, self.is_sqlite)
+        filter_language = filter_key_by_language(language)
 
         if not hasattr(self.model, "keys"):
             raise AttributeError(
                 f"{self.model.__name__} does not have a 'keys' attribute"
             )
 
-        self._statement = self._statement.join(self.model.keys).where(
-            filter_key, filter_language
-        )
-
-        if distinct:
-            self._statement = self._statement.distinct()
-
-        return self
+        return self.where(self.model.keys.any(and_(filter_key, filter_language)))
 
     def by_language(self, language: str | None = None) -> Self:
         """
@@ -149,12 +150,8 @@ class DefinitionSelector(BaseSelector):  # pylint: disable=too-many-ancestors
         Returns:
             Self: The filtered DefinitionSelector instance.
         """
-        if hasattr(self.model, "language"):
-            filter_language = self.model.language == language if language else true()
-        else:
+        if not hasattr(self.model, "language"):
             raise AttributeError(
                 f"{self.model.__name__} does not have a 'language' attribute"
             )
-        self._statement = self._statement.where(filter_language)
-
-        return self
+        return self.where(self.model.language == language) if language else self
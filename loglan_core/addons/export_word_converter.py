@@ -2,103 +2,81 @@
 This module contains ExportWordConverter for Word model of LOD.
 """
 
+from operator import attrgetter
+
 from ..word import BaseWord
 
+_get_abbreviation = attrgetter("abbreviation")
+
 
 class ExportWordConverter:
     """
     A class that provides conversion methods for exporting Word data.
+    All values are computed once when the converter is created.
 
     Args:
         word (BaseWord): The word to be converted.
 
+    Attributes:
+        - e_source (str): The source of the word.
+        - e_year (str): The year of the word, along with any additional notes.
+        - e_usedin (str): The names of the complexes in which the word is used.
+        - e_affixes (str): The affixes (djifoa) created from the word.
+        - e_rank (str): The rank of the word and any additional notes.
+
     Properties:
-        - e_source (str): Returns the source of the word.
-        - e_year (str): Returns the year of the word, along with any additional notes.
-        - e_usedin (str): Returns the names of the complexes in which the word is used.
-        - e_affixes (str): Returns the affixes (djifoa) created from the word.
-        - e_djifoa (str): Alias for the property `e_affixes`.
-        - e_rank (str): Returns the rank of the word and any additional notes.
+        - e_djifoa (str): Alias for the attribute `e_affixes`.
 
     Methods:
         - stringer(value) -> str: Convert a variable to a string.
 
     """
 
+    __slots__ = ("word", "e_source", "e_year", "e_usedin", "e_affixes", "e_rank")
+
     def __init__(self, word: BaseWord):
         self.word = word
+        notes: dict[str, str] = word.notes or {}
 
-    @property
-    def e_source(self) -> str:
-        """
-        Returns:
-        """
-        source = "/".join(sorted([author.abbreviation for author in self.word.authors]))
-        notes: dict[str, str] = self.word.notes or {}
-
-        return f"{source} {notes.get('author', str())}".strip()
-
-    @property
-    def e_year(self) -> str:
-        """
-        Returns the year of the word, along with any additional notes related to the year.
-
-        Returns:
-            str: The year of the word, along with any additional notes.
-            If no year is available, an empty string is returned.
-        """
-        notes: dict[str, str] = self.word.notes or {}
-        if self.word.year:
-            return f"{self.word.year.year} {notes.get('year', str())}".strip()
-        return ""
-
-    @property
-    def e_usedin(self) -> str:
-        """
-        Returns a string that represents the names of the complexes in which the word is used.
+        source = "/".join(sorted(map(_get_abbreviation, word.authors)))
+        self.e_source = f"{source} {notes.get('author', '')}".strip()
 
-        Returns:
-            str: A string with the names of the complexes separated by a vertical bar.
-        """
-        return " | ".join(
-            cpx.name for cpx in self.word.derivatives if cpx.type.group == "Cpx"
+        self.e_year = (
+            f"{word.year.year} {notes.get('year', '')}".strip() if word.year else ""
         )
+        self.e_rank = f"{word.rank} {notes.get('rank', '')}".strip()
+        self.e_usedin, self.e_affixes = self._convert_derivatives(word)
 
-    @property
-    def e_affixes(self) -> str:
+    @staticmethod
+    def _convert_derivatives(word: BaseWord) -> tuple[str, str]:
         """
-        Returns a string representation of the affixes (djifoa) created from the word.
+        Collect the complexes and the affixes (djifoa) of the word in one pass
+        over its derivatives.
 
         Returns:
-            str: A string containing all affixes of the word with hyphens removed.
+            tuple[str, str]: The names of the complexes separated by a vertical bar
+            and the affixes with hyphens removed separated by a space.
         """
-        return " ".join(
-            afx.name.replace("-", "")
-            for afx in self.word.derivatives
-            if afx.type.type_x == "Affix"
-        ).strip()
+        complexes = []
+        affixes = []
+        for derivative in word.derivatives:
+            derivative_type = derivative.type
+            if derivative_type.group == "Cpx":
+                complexes.append(derivative.name)
+            if derivative_type.type_x == "Affix":
+                affixes.append(derivative.name.replace("-", ""))
+        return " | ".join(complexes), " ".join(affixes).strip()
 
     @property
     def e_djifoa(self) -> str:
         """
-        Alias for the property `e_affixes`.
+        Alias for the attribute `e_affixes`.
 
         Returns:
-            str: The value of the property `e_affixes`.
+            str: The value of the attribute `e_affixes`.
         """
         return self.e_affixes
 
-    @property
-    def e_rank(self) -> str:
-        """
-        Return the rank of the word and any additional notes about the rank.
-
-        Returns:
-            str: The rank of the word and any additional notes about the rank.
-        """
-        notes: dict[str, str] = self.word.notes or {}
-        return f"{self.word.rank} {notes.get('rank', str())}".strip()
-
     @staticmethod
     def stringer(value) -> str:
         """
@@ -109,4 +87,4 @@ class ExportWordConverter:
         Returns:
             str:
         """
-        return str(value) if value else str()
+        return f"{value}" if value else ""
@@ -1,9 +1,17 @@
 """
 This module contains an "Export extensions" for LOD dictionary SQL model.
 Add export() function to db object for returning its text string presentation.
+
+Exporting words and definitions reads their relationships, so bulk exports
+should load the objects with `Exporter.select_for_export(model)`, which
+eager-loads everything the export touches instead of one query per object.
 """
 
-from typing import Iterable, Callable, Type
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, TextIO
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from ..addons.export_word_converter import ExportWordConverter
 from ..author import BaseAuthor
@@ -17,6 +25,14 @@ from ..word_spell import BaseWordSpell
 
 DEFAULT_SEPARATOR = "@"
 
+_CODE_NAME_TABLE = str.maketrans(
+    {chr(code): "0" if chr(code).isupper() else "5" for code in range(128)}
+)
+"""Maps ASCII uppercase letters to '0' and any other ASCII character to '5'."""
+
+_stringer = ExportWordConverter.stringer
+"""Bound once, so exporting a word does not look the helper up per field."""
+
 
 class Exporter:
     """
@@ -29,6 +45,10 @@ class Exporter:
     Methods:
         export: The main method that uses a dictionary to map the type of the input object
                 to the respective export method.
+        select_for_export: Builds a statement that eager-loads what the export uses.
+        export_all: Exports several objects, resolving the export method once per type.
+        export_many: Exports the results of a statement in chunks of lines.
+        write_many: Writes the results of a statement to a text file chunk by chunk.
         export_author: Converts a BaseAuthor object to a tuple of items.
         export_definition: Converts a BaseDefinition object to a tuple of items.
         export_event: Converts a BaseEvent object to a tuple of items.
@@ -45,6 +65,18 @@ class Exporter:
     FORMAT_DATE_EVENT = "%m/%d/%Y"
     FORMAT_DATE_SETTING = "%d.%m.%Y %H:%M:%S"
 
+    _EXPORTERS: dict[type, str] = {
+        BaseAuthor: "export_author",
+        BaseEvent: "export_event",
+        BaseType: "export_type",
+        BaseWordSpell: "export_word_spell",
+        BaseWord: "export_word",
+        BaseDefinition: "export_definition",
+        BaseSetting: "export_setting",
+        BaseSyllable: "export_syllable",
+    }
+    """Names of the export methods for the supported base classes."""
+
     @classmethod
     def export(cls, obj, separator: str = DEFAULT_SEPARATOR) -> str:
         """
@@ -58,28 +90,155 @@ class Exporter:
             ValueError: If the object type is not supported.
         """
 
-        exporters: dict[Type, Callable] = {
-            BaseAuthor: cls.export_author,
-            BaseEvent: cls.export_event,
-            BaseType: cls.export_type,
-            BaseWordSpell: cls.export_word_spell,
-            BaseWord: cls.export_word,
-            BaseDefinition: cls.export_definition,
-            BaseSetting: cls.export_setting,
-            BaseSyllable: cls.export_syllable,
-        }
+        items = cls._exporter_func(type(obj))(obj)
+        return cls.merge_by(items, separator)
 
-        exporter_func = None
-        for base_class, func in exporters.items():
-            if isinstance(obj, base_class):
-                exporter_func = func
-                break
+    @classmethod
+    def export_all(
+        cls, objs: Iterable, separator: str = DEFAULT_SEPARATOR
+    ) -> list[str]:
+        """
+        Export the given objects, keeping their order.
+        The exporter function is resolved once per object type.
+        Args:
+            objs: The objects to be exported.
+            separator: The separator to be used in the exported strings.
+        Returns:
+            The exported objects.
+        Raises:
+            ValueError: If some object type is not supported.
+        """
+        exporter_funcs: dict[type, Callable] = {}
+        merge_by = cls.merge_by
+        exported = []
+        for obj in objs:
+            obj_type = type(obj)
+            exporter_func = exporter_funcs.get(obj_type)
+            if exporter_func is None:
+                exporter_func = exporter_funcs[obj_type] = cls._exporter_func(obj_type)
+            exported.append(merge_by(exporter_func(obj), separator))
+        return exported
 
-        if not exporter_func:
-            raise ValueError(f"Unsupported object type: {obj.__class__}")
+    @classmethod
+    def export_many(
+        cls,
+        session: Session,
+        statement: Select,
+        *,
+        chunk_size: int = 1000,
+        separator: str = DEFAULT_SEPARATOR,
+        line_separator: str = "\n",
+    ) -> Iterator[str]:
+        """
+        Export the objects selected by the statement, fetching them in batches.
+        Args:
+            session: The session to execute the statement with.
+            statement: The statement selecting the objects to be exported,
+                e.g. one built with `select_for_export`.
+            chunk_size: The number of objects to fetch and export at once.
+            separator: The separator to be used in the exported strings.
+            line_separator: The separator between the exported objects of a chunk.
+        Yields:
+            str: The exported objects of each chunk joined by the line separator.
+        Raises:
+            ValueError: If the object type is not supported.
+        """
+        result = session.scalars(statement.execution_options(yield_per=chunk_size))
+        try:
+            for partition in result.partitions():
+                yield line_separator.join(cls.export_all(partition, separator))
+        finally:
+            result.close()
 
-        items = exporter_func(obj)
-        return cls.merge_by(items, separator)
+    @classmethod
+    def write_many(
+        cls,
+        file: TextIO,
+        session: Session,
+        statement: Select,
+        *,
+        chunk_size: int = 1000,
+        separator: str = DEFAULT_SEPARATOR,
+        line_separator: str = "\n",
+    ) -> None:
+        """
+        Write the exported objects selected by the statement to a text file.
+        Every chunk is written as soon as it is exported,
+        so the whole export is never held in memory as one string.
+        Args:
+            file: The text stream to write to, e.g. opened with encoding="utf-8".
+            session: The session to execute the statement with.
+            statement: The statement selecting the objects to be exported.
+            chunk_size: The number of objects to fetch and export at once.
+            separator: The separator to be used in the exported strings.
+            line_separator: The separator written after every exported object.
+        Raises:
+            ValueError: If the object type is not supported.
+        """
+        for chunk in cls.export_many(
+            session,
+            statement,
+            chunk_size=chunk_size,
+            separator=separator,
+            line_separator=line_separator,
+        ):
+            file.write(chunk)
+            file.write(line_separator)
+
+    @staticmethod
+    def select_for_export(model: type) -> Select:
+        """
+        Build a statement selecting the model with the relationships
+        used by its export method loaded eagerly.
+        Args:
+            model: The model class to be exported.
+        Returns:
+            Select: The statement to execute, e.g. with session.scalars().
+        """
+        statement = select(model)
+        if issubclass(model, BaseWordSpell):
+            return statement.options(joinedload(model.event_end))
+        if issubclass(model, BaseWord):
+            return statement.options(
+                selectinload(model.authors),
+                selectinload(model.derivatives),
+            )
+        if issubclass(model, BaseDefinition):
+            return statement.options(joinedload(model.source_word))
+        return statement
+
+    @classmethod
+    def _exporter_func(cls, obj_type: type) -> Callable:
+        """
+        Get the export method for the given type.
+        Args:
+            obj_type: The type of the object to be exported.
+        Returns:
+            The export method.
+        Raises:
+            ValueError: If the type is not supported.
+        """
+        exporter_name = cls._exporter_name(obj_type)
+        if exporter_name is None:
+            raise ValueError(f"Unsupported object type: {obj_type}")
+        return getattr(cls, exporter_name)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _exporter_name(cls, obj_type: type) -> str | None:
+        """
+        Find the export method name for the given type, caching the result.
+        The closest supported base class in the type's MRO wins.
+        Args:
+            obj_type: The type of the object to be exported.
+        Returns:
+            The name of the export method, or None if the type is not supported.
+        """
+        for base_class in obj_type.__mro__:
+            exporter_name = cls._EXPORTERS.get(base_class)
+            if exporter_name is not None:
+                return exporter_name
+        return None
 
     @staticmethod
     def merge_by(items: Iterable, separator: str = DEFAULT_SEPARATOR) -> str:
@@ -92,8 +251,9 @@ class Exporter:
                          value.
         Returns:
         str: The resulting string after joining the items.
+        Empty items (None, "", 0, False) are exported as empty strings.
         """
-        return separator.join([str(i or "") for i in items])
+        return separator.join([f"{item}" if item else "" for item in items])
 
     @staticmethod
     def export_author(obj: BaseAuthor) -> tuple:
@@ -172,10 +332,10 @@ class Exporter:
             tuple: elements for export
         """
         ewc = ExportWordConverter(obj)
-        match = ewc.stringer(obj.match)
-        tid_old = ewc.stringer(obj.tid_old)
-        origin_x = ewc.stringer(obj.origin_x)
-        origin = ewc.stringer(obj.origin)
+        match = _stringer(obj.match)
+        tid_old = _stringer(obj.tid_old)
+        origin_x = _stringer(obj.origin_x)
+        origin = _stringer(obj.origin)
         return (
             obj.id_old,
             obj.type.type_,
@@ -218,8 +378,11 @@ class Exporter:
         Returns:
             tuple: elements for export
         """
-        code_name = "".join(
-            "0" if symbol.isupper() else "5" for symbol in str(obj.name)
+        name = str(obj.name)
+        code_name = (
+            name.translate(_CODE_NAME_TABLE)
+            if name.isascii()
+            else "".join("0" if symbol.isupper() else "5" for symbol in name)
         )
         return (
             obj.id_old,
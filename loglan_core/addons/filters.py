@@ -2,6 +2,9 @@
 This module provides utility functions for the loglan_core package.
 """
 
+from functools import lru_cache
+from typing import Any
+
 from sqlalchemy import select, true, func
 from sqlalchemy.sql.elements import BinaryExpression
 from sqlalchemy.sql.elements import BooleanClauseList
@@ -11,10 +14,29 @@ from ..event import BaseEvent
 from ..key import BaseKey
 from ..word import BaseWord
 
+_LATEST_EVENT_ID = select(func.max(BaseEvent.event_id)).scalar_subquery()
+"""The id of the latest event, shared by the filters that default to it."""
+
+
+def to_like_pattern(value: Any) -> str:
+    """
+    Convert the '*' wildcards of a search value to the SQL '%' ones.
+    A value without '*' is returned as is, since `str.replace` does not copy it.
+
+    Args:
+        value: The value to convert. Non-string values are cast with str().
+
+    Returns:
+        str: The pattern to use with LIKE-style operators.
+    """
+    return str(value).replace("*", "%")
+
 
+@lru_cache(maxsize=64)
 def filter_word_by_event_id(event_id: int | None) -> BooleanClauseList:
     """
     Returns a filter condition to select words associated with a specific event.
+    The conditions are immutable, so they are built once per event id and reused.
 
     Args:
         event_id: The id of the event to filter by. Defaults to None.
@@ -22,8 +44,7 @@ def filter_word_by_event_id(event_id: int | None) -> BooleanClauseList:
     Returns:
         BooleanClauseList: A filter condition to select words associated with a specific event.
     """
-    latest_id = select(func.max(BaseEvent.event_id)).scalar_subquery()
-    event_id_filter = event_id or latest_id
+    event_id_filter = event_id or _LATEST_EVENT_ID
     start_id_condition = BaseWord.event_start_id <= event_id_filter
     end_id_condition = (
         BaseWord.event_end_id > event_id_filter
@@ -37,7 +58,7 @@ def filter_key_by_word_cs(
     is_sqlite: bool = False,
 ) -> BinaryExpression:
     """case sensitive name filter"""
-    key = str(key).replace("*", "%")
+    key = to_like_pattern(key)
     return (
         (BaseKey.word.op("GLOB")(key) if is_sqlite else BaseKey.word.like(key))
         if case_sensitive
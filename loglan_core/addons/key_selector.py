@@ -1,5 +1,5 @@
 """
-This module provides the `KeySelector` class, which inherits from `Select`
+This module provides the `KeySelector` class, which inherits from `BaseSelector`
 and provides methods for filtering keys based on certain criteria.
 
 The KeySelector class has methods to filter keys by event ID, key, and language.
@@ -51,6 +51,8 @@ class KeySelector(BaseSelector):  # pylint: disable=too-many-ancestors
         disable_model_check (bool): If the model check is disabled during initialization.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         model: Type[BaseKey] = BaseKey,
@@ -91,16 +93,20 @@ class KeySelector(BaseSelector):  # pylint: disable=too-many-ancestors
             KeySelector: The filtered KeySelector instance.
         """
 
-        subquery = (
-            select(self.model.id)
-            .join(t_connect_keys)
-            .join(BaseDefinition)
-            .join(BaseWord)
-            .where(filter_word_by_event_id(event_id))
-            .scalar_subquery()
+        # Correlate only the keys, as the outer statement may join the same tables
+        word_in_event = (
+            select(1)
+            .select_from(t_connect_keys)
+            .join(BaseDefinition, BaseDefinition.id == t_connect_keys.c.DID)
+            .join(BaseWord, BaseWord.id == BaseDefinition.word_id)
+            .where(
+                t_connect_keys.c.KID == self.model.id,
+                filter_word_by_event_id(event_id),
+            )
+            .correlate(self.model)
+            .exists()
         )
-        self._statement = self._statement.where(self.model.id.in_(subquery))
-        return self
+        return self.where(word_in_event)
 
     def by_key(self, key: str) -> KeySelector:
         """
@@ -112,10 +118,9 @@ class KeySelector(BaseSelector):  # pylint: disable=too-many-ancestors
         Returns:
             KeySelector: The filtered KeySelector instance.
         """
-        self._statement = self._statement.where(
+        return self.where(
             filter_key_by_word_cs(key, self.case_sensitive, self.is_sqlite)
         )
-        return self
 
     def by_language(self, language: str | None = None) -> KeySelector:
         """
@@ -128,8 +133,7 @@ class KeySelector(BaseSelector):  # pylint: disable=too-many-ancestors
         Returns:
             KeySelector: The filtered KeySelector instance.
         """
-        self._statement = self._statement.where(filter_key_by_language(language))
-        return self
+        return self.where(filter_key_by_language(language)) if language else self
 
     def by_word_id(self, word_id: int, distinct: bool = False) -> KeySelector:
         """
@@ -150,9 +154,9 @@ class KeySelector(BaseSelector):  # pylint: disable=too-many-ancestors
             self._statement.join(t_connect_keys)
             .join(BaseDefinition, BaseDefinition.id == t_connect_keys.c.DID)
             .join(BaseWord, BaseWord.id == BaseDefinition.word_id)
-            .filter(BaseWord.id == word_id)
             .order_by(BaseKey.word.asc())
         )
+        self.where(BaseWord.id == word_id)
 
         if distinct:
             self._statement = self._statement.distinct()
@@ -8,13 +8,13 @@ from __future__ import annotations
 
 from typing import Type
 
-from sqlalchemy import and_, select
+from sqlalchemy import select
 from typing_extensions import Self
 
 from loglan_core.relationships import t_connect_words
 from .base_selector import BaseSelector
 from .definition_selector import DefinitionSelector
-from .filters import filter_word_by_event_id
+from .filters import filter_word_by_event_id, to_like_pattern
 from ..key import BaseKey
 from ..type import BaseType
 from ..word import BaseWord
@@ -24,9 +24,11 @@ class WordSelector(BaseSelector):  # pylint: disable=too-many-ancestors
     """
     Class to extract words from a database based on various criteria.
 
-    Extends the SQLAlchemy Select class to provide additional functionality.
+    Wraps a SQLAlchemy Select statement to provide additional functionality.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         model: Type[BaseWord] = BaseWord,
@@ -70,8 +72,7 @@ class WordSelector(BaseSelector):  # pylint: disable=too-many-ancestors
         Returns:
             Self: A query with the filter applied.
         """
-        self._statement = self._statement.where(filter_word_by_event_id(event_id))
-        return self
+        return self.where(filter_word_by_event_id(event_id))
 
     def by_name(
         self,
@@ -93,8 +94,7 @@ class WordSelector(BaseSelector):  # pylint: disable=too-many-ancestors
                 f"{self.model.__name__} does not have a 'name' attribute"
             )
 
-        self._statement = self._statement.where(condition)
-        return self
+        return self.where(condition)
 
     def by_key(
         self,
@@ -122,8 +122,7 @@ class WordSelector(BaseSelector):  # pylint: disable=too-many-ancestors
             language=language,
         )
         subquery = select(definition_query.get_statement().subquery().c.word_id)
-        self._statement = self._statement.where(self.model.id.in_(subquery))
-        return self
+        return self.where(self.model.id.in_(subquery))
 
     def by_type(
         self,
@@ -149,10 +148,8 @@ class WordSelector(BaseSelector):  # pylint: disable=too-many-ancestors
             Self: A query with the filter applied.
         """
         if isinstance(type_, BaseType):
-            self._statement = self._statement.join(BaseType).where(
-                BaseType.id == type_.id
-            )
-            return self
+            self._statement = self._statement.join(BaseType)
+            return self.where(BaseType.id == type_.id)
 
         type_values = (
             (BaseType.type_, type_),
@@ -161,15 +158,16 @@ class WordSelector(BaseSelector):  # pylint: disable=too-many-ancestors
         )
 
         type_filters = [
-            i[0].ilike(str(i[1]).replace("*", "%")) for i in type_values if i[1]
+            column.ilike(to_like_pattern(value))
+            for column, value in type_values
+            if value
         ]
 
         if not type_filters:
-            self._statement = self._statement
             return self
 
-        self._statement = self._statement.join(BaseType).where(and_(*type_filters))
-        return self
+        self._statement = self._statement.join(BaseType)
+        return self.where(*type_filters)
 
     def get_derivatives_of(self, word_id: int) -> Self:
         """
@@ -186,10 +184,7 @@ class WordSelector(BaseSelector):  # pylint: disable=too-many-ancestors
             t_connect_words.c.parent_id == word_id
         )
 
-        self._statement = self._statement.where(
-            self.model.id.in_(derivative_ids_subquery)
-        )
-        return self
+        return self.where(self.model.id.in_(derivative_ids_subquery))
 
     def get_affixes_of(self, word_id: int) -> Self:
         """
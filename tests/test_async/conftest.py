@@ -7,13 +7,15 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncTransaction,
 )
+from sqlalchemy.pool import StaticPool
 
 from loglan_core import Base
 from ..objects import add_objects
 
 DATABASE_URL = "sqlite+aiosqlite://"
 
-engine = create_async_engine(DATABASE_URL)
+# a single shared connection keeps the in-memory database alive for the whole session
+engine = create_async_engine(DATABASE_URL, poolclass=StaticPool)
 
 
 # Required per https://anyio.readthedocs.io/en/stable/testing.html#using-async-fixtures-with-higher-scopes
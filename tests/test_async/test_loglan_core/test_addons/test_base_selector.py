@@ -17,6 +17,31 @@ async def test_all(session):
     assert len(all_words) == 13
 
 
+@pytest.mark.usefixtures("session")
+async def test_rows(session):
+    rows = await (
+        WordSelector().select_columns(BaseWord.id, BaseWord.name).rows_async(session)
+    )
+    assert len(rows) == 13
+    assert all(len(row) == 2 for row in rows)
+
+
+@pytest.mark.usefixtures("session")
+async def test_rows_strict_relationships(session):
+    rows = await (
+        WordSelector()
+        .strict_relationships()
+        .select_columns(BaseWord.id, BaseWord.name)
+        .rows_async(session)
+    )
+    assert len(rows) == 13
+
+
+@pytest.mark.usefixtures("session")
+async def test_count(session):
+    assert await WordSelector().count_async(session) == 13
+
+
 @pytest.mark.usefixtures("session")
 async def test_scalar(session):
     word = await WordSelector().scalar_async(session)
@@ -27,3 +52,10 @@ async def test_scalar(session):
 async def test_fetchmany(session):
     fetch_words = await WordSelector().fetchmany_async(session, size=5)
     assert len(fetch_words) == 5
+
+
+@pytest.mark.usefixtures("session")
+async def test_stream(session):
+    result = await WordSelector().stream_async(session, yield_per=5)
+    words = [word async for word in result]
+    assert len(words) == 13
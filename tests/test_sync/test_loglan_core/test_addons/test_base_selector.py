@@ -2,8 +2,11 @@ from datetime import date
 
 import pytest
 from sqlalchemy import Result
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import joinedload
+from sqlalchemy.sql import operators
 
-from loglan_core import WordSelector
+from loglan_core import KeySelector, WordSelector
 from loglan_core.word import BaseWord
 
 
@@ -34,6 +37,96 @@ class TestBaseSelector:
         )
         assert kak_with_all_relationships.__dict__.get("definitions") is not None
 
+    def test_with_single_relationship_name(self, db_session):
+        kakto = (
+            WordSelector()
+            .by_name("kakto")
+            .with_relationships("definitions")
+            .scalar(db_session)
+        )
+        assert kakto.__dict__.get("definitions") is not None
+        assert kakto.__dict__.get("authors") is None
+
+    def test_with_unknown_relationships(self):
+        with pytest.raises(AttributeError) as _:
+            WordSelector().with_relationships(["definitions", "wrong_name"])
+
+    def test_with_empty_relationships(self, db_session):
+        ws = WordSelector().by_name("pruci")
+        statement = ws.get_statement()
+        assert ws.with_relationships([]).get_statement() is statement
+
+        pruci = ws.scalar(db_session)
+        assert pruci.__dict__.get("definitions") is None
+
+    def test_with_collection_relationships_all(self, db_session):
+        words = WordSelector().with_relationships(["definitions"]).all(db_session)
+        assert len(words) == 13
+        assert all("definitions" in word.__dict__ for word in words)
+
+    def test_with_relationships_strategy(self, db_session):
+        statement = (
+            WordSelector()
+            .with_relationships(["definitions"], strategy=joinedload)
+            .get_statement()
+        )
+        assert "JOIN" in str(statement)
+
+        words = db_session.scalars(statement).unique().all()
+        assert len(words) == 13
+        assert all("definitions" in word.__dict__ for word in words)
+
+    def test_strict_relationships(self, db_session):
+        kakto = (
+            WordSelector()
+            .by_name("kakto")
+            .with_relationships(["definitions"])
+            .strict_relationships()
+            .scalar(db_session)
+        )
+        assert kakto.definitions
+        assert kakto.type.type_ == "C-Prim"
+
+        with pytest.raises(InvalidRequestError) as _:
+            _ = kakto.authors
+
+    def test_strict_relationships_before_with_relationships(self, db_session):
+        kakto = (
+            WordSelector()
+            .by_name("kakto")
+            .strict_relationships()
+            .with_relationships(["definitions"])
+            .scalar(db_session)
+        )
+        assert kakto.definitions
+        assert kakto.type.type_ == "C-Prim"
+
+        with pytest.raises(InvalidRequestError) as _:
+            _ = kakto.authors
+
+    def test_strict_relationships_with_selected_columns(self, db_session):
+        selector = (
+            WordSelector()
+            .by_name("kakto")
+            .strict_relationships()
+            .select_columns(BaseWord.name, BaseWord.id)
+        )
+        assert selector.all(db_session) == ["kakto"]
+        assert [tuple(row) for row in selector.rows(db_session)] == [("kakto", 2)]
+
+    def test_with_relationships_strict(self, db_session):
+        kakto = (
+            WordSelector()
+            .by_name("kakto")
+            .with_relationships({"definitions"}, strict=True)
+            .scalar(db_session)
+        )
+        assert kakto.definitions
+        assert kakto.type.type_ == "C-Prim"
+
+        with pytest.raises(InvalidRequestError) as _:
+            _ = kakto.authors
+
     def test_execute(self, db_session):
         result = WordSelector().execute(db_session)
         assert isinstance(result, Result)
@@ -46,6 +139,10 @@ class TestBaseSelector:
         fetch_5 = WordSelector().fetchmany(db_session, 5)
         assert len(fetch_5) == 5
 
+    def test_stream(self, db_session):
+        streamed = list(WordSelector().stream(db_session, yield_per=5))
+        assert streamed == WordSelector().all(db_session)
+
     def test_limit(self, db_session):
         limit_6 = WordSelector().limit(6).all(db_session)
         assert len(limit_6) == 6
@@ -65,6 +162,63 @@ class TestBaseSelector:
         assert len(result) == 3
         assert all(isinstance(item, str) for item in result)
 
+    def test_select_columns_keeps_limit_and_order(self, db_session):
+        result = (
+            WordSelector()
+            .order_by(BaseWord.name.desc())
+            .limit(2)
+            .select_columns(BaseWord.name)
+            .all(db_session)
+        )
+        all_names = WordSelector().select_columns(BaseWord.name).all(db_session)
+        assert result == sorted(all_names, reverse=True)[:2]
+
+    def test_filter_by(self, db_session):
+        words = WordSelector().filter_by(name="kakto").all(db_session)
+        assert [word.name for word in words] == ["kakto"]
+
+        with pytest.raises(InvalidRequestError) as _:
+            WordSelector().filter_by(wrong_name="kakto")
+
+    def test_filter_by_after_join(self, db_session):
+        words = WordSelector().by_type("C-Prim").filter_by(type_="C-Prim")
+        assert len(words.all(db_session)) == 2
+
+        keys = KeySelector().by_word_id(2).filter_by(name="kakto").all(db_session)
+        assert len(keys) == 6
+
+    def test_count(self, db_session):
+        assert WordSelector().count(db_session) == 13
+        assert WordSelector().by_name("ka*").order_by(BaseWord.name).count(
+            db_session
+        ) == len(WordSelector().by_name("ka*").all(db_session))
+
+    def test_yield_per(self, db_session):
+        selector = WordSelector().yield_per(5)
+        assert selector.get_statement().get_execution_options()["yield_per"] == 5
+
+        words = list(selector.execute(db_session).scalars())
+        assert len(words) == 13
+
+    def test_rows(self, db_session):
+        result = (
+            WordSelector()
+            .by_name("ka*")
+            .select_columns(BaseWord.id, BaseWord.name)
+            .rows(db_session)
+        )
+        assert len(result) == 3
+        assert all(isinstance(word_id, int) for word_id, _ in result)
+        assert all(name.startswith("ka") for _, name in result)
+
+    def test_statement_cache_key_is_shared(self):
+        first = WordSelector().by_name("kakto").limit(3).get_statement()
+        second = WordSelector().by_name("pruci").limit(5).get_statement()
+        assert first._generate_cache_key() == second._generate_cache_key()
+
+    def test_has_no_instance_dict(self):
+        assert not hasattr(WordSelector(), "__dict__")
+
     def test_order_by(self, db_session):
         result_asc = WordSelector().order_by(BaseWord.name).all(db_session)
         result_unsorted = WordSelector().all(db_session)
@@ -91,6 +245,13 @@ class TestBaseSelector:
         assert len(result) == 1
         assert result[0].name == "kakto"
 
+    def test_where_is_applied_once(self, db_session):
+        ws = WordSelector().where(BaseWord.name.like("ka%")).where(BaseWord.id > 0)
+        statement = ws.get_statement()
+        assert ws.get_statement() is statement
+        assert len(statement.whereclause.clauses) == 2
+        assert len(ws.all(db_session)) == 3
+
     def test_where_like_case_sensitive(self, db_session):
         result = (
             WordSelector(case_sensitive=True, is_sqlite=True)
@@ -115,6 +276,10 @@ class TestBaseSelector:
         )
         assert len(result) == 1
 
+    def test_where_like_int_collection(self, db_session):
+        result = WordSelector().where_like(id=[1, "2", 3]).all(db_session)
+        assert sorted(word.id for word in result) == [1, 2, 3]
+
     def test_where_like_date(self, db_session):
         result = (
             WordSelector(case_sensitive=False, is_sqlite=True)
@@ -130,10 +295,54 @@ class TestBaseSelector:
         with pytest.raises(AttributeError) as _:
             WordSelector().get_like_condition("wrong_name", "test")
 
+    def test_get_like_condition_exact_match(self, db_session):
+        condition = WordSelector(
+            case_sensitive=True, is_sqlite=True
+        ).get_like_condition("name", "kakto")
+        assert condition.operator is operators.eq
+
+        words = WordSelector().where(condition).all(db_session)
+        assert [word.name for word in words] == ["kakto"]
+
+    @pytest.mark.parametrize(
+        "is_sqlite, pattern",
+        [
+            (False, "ka%"),
+            (False, "ka_"),
+            (True, "ka?"),
+            (True, "ka[ko]"),
+        ],
+    )
+    def test_get_like_condition_operator_wildcards(
+        self, db_session, is_sqlite, pattern
+    ):
+        condition = WordSelector(
+            case_sensitive=True, is_sqlite=is_sqlite
+        ).get_like_condition("name", pattern)
+        assert condition.operator is not operators.eq
+
+        words = WordSelector().where(condition).all(db_session)
+        expected = {"ka%": ["kak", "kakto", "kao"]}.get(pattern, ["kak", "kao"])
+        assert sorted(word.name for word in words) == expected
+
+    def test_get_like_condition_after_changing_flags(self, db_session):
+        selector = WordSelector()
+        assert "lower" in str(selector.get_like_condition("name", "ka*"))
+
+        selector.case_sensitive = True
+        selector.is_sqlite = True
+        assert selector.case_sensitive and selector.is_sqlite
+        assert selector.get_like_condition("name", "kak").operator is operators.eq
+
+        condition = selector.get_like_condition("name", "ka?")
+        assert "GLOB" in str(condition)
+        words = WordSelector().where(condition).all(db_session)
+        assert sorted(word.name for word in words) == ["kak", "kao"]
+
     def test_get_like_condition(self, db_session):
         # trick to get the coverage because we use sqlite but specify as False
         wrong_cond = WordSelector(
             case_sensitive=True, is_sqlite=False
-        ).get_like_condition("name", "kakto")
+        ).get_like_condition("name", "kakt*")
         word = WordSelector().where(wrong_cond).scalar(db_session)
         assert word.name == "kakto"
@@ -1,6 +1,7 @@
 """DefinitionSelector unit tests."""
 
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 
 from loglan_core.addons.definition_selector import DefinitionSelector
 from loglan_core.addons.key_selector import KeySelector
@@ -37,6 +38,23 @@ class TestDefinitionSelector:
         definitions = DefinitionSelector().by_language("es").all(db_session)
         assert len(definitions) == 2
 
+    def test_by_language_none(self, db_session):
+        selector = DefinitionSelector()
+        statement = selector.get_statement()
+        assert selector.by_language(None).get_statement() is statement
+        assert len(selector.all(db_session)) == 17
+
+    def test_with_relationships_strict(self, db_session):
+        definition = (
+            DefinitionSelector()
+            .with_relationships(["source_word"], strict=True)
+            .scalar(db_session)
+        )
+        assert definition.source_word.type.type_
+
+        with pytest.raises(InvalidRequestError) as _:
+            _ = definition.keys
+
     def test_by_key_as_str(self, db_session):
         definitions = DefinitionSelector().by_key("test").all(db_session)
         assert len(definitions) == 5
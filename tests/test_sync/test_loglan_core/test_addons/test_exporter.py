@@ -2,7 +2,10 @@
 
 """Export Model unit tests."""
 
+import io
+
 import pytest
+from sqlalchemy import select
 
 from loglan_core.addons.exporter import Exporter
 from loglan_core.addons.export_word_converter import ExportWordConverter
@@ -101,3 +104,59 @@ class TestExporter:
         obj = db_session.query(WordSpell).filter(Word.name == "prukao").scalar()
         result = self.e.export(obj)
         assert result == "7191@prukao@prukao@555555@3@9999@"
+
+        obj.name = "PruKao"
+        result = self.e.export(obj)
+        assert result == "7191@PruKao@prukao@055055@3@9999@"
+
+        obj.name = "Ünä"
+        result = self.e.export(obj)
+        assert result == "7191@Ünä@ünä@055@3@9999@"
+
+    def test_select_for_export(self, db_session):
+        words = db_session.scalars(self.e.select_for_export(Word)).all()
+        assert all("derivatives" in word.__dict__ for word in words)
+        assert all("authors" in word.__dict__ for word in words)
+
+        kakto = next(word for word in words if word.name == "kakto")
+        assert self.e.export(kakto).startswith("3880@C-Prim@Predicate@kak kao@")
+
+        definitions = db_session.scalars(self.e.select_for_export(Definition)).all()
+        assert all("source_word" in d.__dict__ for d in definitions)
+
+        authors = db_session.scalars(self.e.select_for_export(Author)).all()
+        assert authors
+
+    def test_export_all(self, db_session):
+        objs = [
+            db_session.query(Author).filter(Author.abbreviation == "JCB").scalar(),
+            db_session.query(Syllable).filter(Syllable.name == "vr").scalar(),
+            db_session.query(Author).filter(Author.abbreviation == "JCB").scalar(),
+        ]
+        assert self.e.export_all(objs) == [self.e.export(obj) for obj in objs]
+
+        with pytest.raises(ValueError) as _:
+            self.e.export_all([*objs, object()])
+
+    def test_export_many(self, db_session):
+        names = ["kak", "kakto", "kao", "pru", "pruci", "prukao"]
+        statement = (
+            self.e.select_for_export(Word).where(Word.name.in_(names)).order_by(Word.id)
+        )
+        chunks = list(self.e.export_many(db_session, statement, chunk_size=4))
+        assert len(chunks) == 2
+
+        words = db_session.scalars(
+            select(Word).where(Word.name.in_(names)).order_by(Word.id)
+        ).all()
+        assert "\n".join(chunks) == "\n".join(self.e.export(word) for word in words)
+
+    def test_write_many(self, db_session):
+        statement = self.e.select_for_export(Author).order_by(Author.id)
+        file = io.StringIO()
+        self.e.write_many(file, db_session, statement, chunk_size=1)
+
+        authors = db_session.scalars(select(Author).order_by(Author.id)).all()
+        assert file.getvalue() == "".join(
+            f"{self.e.export(author)}\n" for author in authors
+        )
@@ -90,6 +90,16 @@ class TestKeySelector:
         keys = KeySelector(is_sqlite=True).by_word_id(kakto.id).all(db_session)
         assert len(keys) == 6
 
+    @staticmethod
+    def test_by_word_id_and_by_event(db_session):
+        prukao = WordSelector(is_sqlite=True).by_name("prukao").scalar(db_session)
+        for event_id, expected in ((2, [2, 2, 4, 6]), (3, [1, 2, 2, 3, 4, 5, 6])):
+            keys = KeySelector().by_word_id(prukao.id).by_event(event_id)
+            assert sorted(key.id for key in keys.all(db_session)) == expected
+
+            keys = KeySelector().by_event(event_id).by_word_id(prukao.id)
+            assert sorted(key.id for key in keys.all(db_session)) == expected
+
     @staticmethod
     def test_by_word_id_distinct(db_session):
         kakto = WordSelector(is_sqlite=True).by_name("kakto").scalar(db_session)
@@ -1,6 +1,17 @@
+import datetime
+import subprocess
+import sys
+
 import pytest
 from loglan_core import Word
-import datetime
+
+
+def _run_in_fresh_interpreter(code: str) -> str:
+    """Run the code in a new interpreter, so no models are imported beforehand."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
 
 
 @pytest.mark.usefixtures("db_session")
@@ -61,3 +72,17 @@ class TestBase:
         assert Word.non_foreign_keys() == {
             'TID_old', 'created', 'id', 'id_old', 'match', 'name',
             'notes', 'origin', 'origin_x', 'rank', 'updated', 'year'}
+
+    def test_metadata_has_all_tables(self):
+        tables = _run_in_fresh_interpreter(
+            "from loglan_core import Base; print(' '.join(sorted(Base.metadata.tables)))"
+        )
+        assert tables.split() == [
+            "authors", "connect_authors", "connect_keys", "connect_words",
+            "definitions", "events", "keys", "settings", "syllables", "types", "words",
+        ]
+
+    def test_addons_package_is_available(self):
+        assert _run_in_fresh_interpreter(
+            "import loglan_core; print(loglan_core.addons.__name__)"
+        ) == "loglan_core.addons"